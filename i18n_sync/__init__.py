@@ -2,6 +2,12 @@
 
 __version__ = "0.6.0"
 
-from .sync import I18nSync
+__all__ = ["I18nSync"]
 
-__all__ = ["I18nSync"]
\ No newline at end of file
+
+def __getattr__(name):
+    # Import lazily so the CLI can start without loading PyYAML
+    if name == "I18nSync":
+        from .sync import I18nSync
+        return I18nSync
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
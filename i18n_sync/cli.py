@@ -2,8 +2,9 @@
 
 import click
 import sys
-from pathlib import Path
-from .sync import I18nSync
+
+# I18nSync is imported inside each command: loading it pulls in PyYAML, which
+# would otherwise slow down `--help` and shell completion.
 
 
 @click.group()
@@ -21,6 +22,8 @@ def cli():
               help='Source language that defines the canonical key list (default: en)')
 def extract(resources, output, source_lang):
     """Extract all .strings files to translations.yaml."""
+    from .sync import I18nSync
+
     try:
         sync = I18nSync(resources_path=resources, yaml_path=output, source_lang=source_lang)
         sync.extract()
@@ -39,6 +42,8 @@ def extract(resources, output, source_lang):
               help='Path to Resources directory (default: Resources)')
 def apply(input, resources):
     """Apply translations.yaml back to .strings files."""
+    from .sync import I18nSync
+
     try:
         sync = I18nSync(resources_path=resources, yaml_path=input)
         sync.apply()
@@ -59,6 +64,8 @@ def apply(input, resources):
               help='Default language for values/ folder (default: en)')
 def apply_android(input, res, default_lang):
     """Apply translations.yaml to Android strings.xml files."""
+    from .sync import I18nSync
+
     try:
         sync = I18nSync(yaml_path=input)
         sync.apply_android(res_path=res, default_lang=default_lang)
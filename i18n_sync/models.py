@@ -1,12 +1,18 @@
 """Data models for i18n-sync."""
 
+from dataclasses import dataclass, field
 from typing import Dict, Optional
-from pydantic import BaseModel, Field
 
 
-class TranslationKey(BaseModel):
+def sort_languages(translations: Dict) -> Dict:
+    """Return a copy of a {lang: value} dict ordered alphabetically with 'en' first."""
+    return {lang: translations[lang] for lang in sorted(translations, key=lambda lang: (lang != 'en', lang))}
+
+
+@dataclass
+class TranslationKey:
     """A single translation key with all its language values."""
-    translations: Dict[str, str] = Field(default_factory=dict)
+    translations: Dict[str, str] = field(default_factory=dict)
 
     def add_translation(self, lang: str, value: str):
         self.translations[lang] = value
@@ -15,15 +21,17 @@ class TranslationKey(BaseModel):
         return self.translations.get(lang)
 
 
-class StringsSection(BaseModel):
+@dataclass
+class StringsSection:
     """A section of strings (e.g., Localizable or InfoPlist)."""
     name: str
-    keys: Dict[str, TranslationKey] = Field(default_factory=dict)
+    keys: Dict[str, TranslationKey] = field(default_factory=dict)
 
     def add_key(self, key: str, lang: str, value: str):
-        if key not in self.keys:
-            self.keys[key] = TranslationKey()
-        self.keys[key].add_translation(lang, value)
+        trans_key = self.keys.get(key)
+        if trans_key is None:
+            trans_key = self.keys[key] = TranslationKey()
+        trans_key.translations[lang] = value
 
     def get_languages(self) -> set[str]:
         """Get all languages used in this section."""
@@ -33,20 +41,24 @@ class StringsSection(BaseModel):
         return languages
 
 
-class TranslationsData(BaseModel):
+@dataclass
+class TranslationsData:
     """The complete translations data structure."""
-    sections: Dict[str, StringsSection] = Field(default_factory=dict)
+    sections: Dict[str, StringsSection] = field(default_factory=dict)
 
     def add_section(self, name: str) -> StringsSection:
-        if name not in self.sections:
-            self.sections[name] = StringsSection(name=name)
-        return self.sections[name]
+        section = self.sections.get(name)
+        if section is None:
+            section = self.sections[name] = StringsSection(name=name)
+        return section
 
     def get_all_languages(self) -> set[str]:
         """Get all languages across all sections."""
+        # Accumulate into one set rather than building a set per section
         languages = set()
         for section in self.sections.values():
-            languages.update(section.get_languages())
+            for trans_key in section.keys.values():
+                languages.update(trans_key.translations)
         return languages
 
     def to_yaml_dict(self) -> Dict:
@@ -55,23 +67,19 @@ class TranslationsData(BaseModel):
         for section_name, section in self.sections.items():
             result[section_name] = {}
             for key, trans_key in section.keys.items():
-                # Sort languages with 'en' first if it exists
-                sorted_langs = {}
-                if 'en' in trans_key.translations:
-                    sorted_langs['en'] = trans_key.translations['en']
-                for lang in sorted(trans_key.translations.keys()):
-                    if lang != 'en':
-                        sorted_langs[lang] = trans_key.translations[lang]
-                result[section_name][key] = sorted_langs
+                result[section_name][key] = sort_languages(trans_key.translations)
         return result
 
     @classmethod
     def from_yaml_dict(cls, data: Dict) -> "TranslationsData":
         """Create from a dict loaded from YAML."""
         trans_data = cls()
+        # The YAML loader creates a new string for every occurrence of a
+        # language code; share one object per language instead
+        languages = {}
         for section_name, section_data in data.items():
             section = trans_data.add_section(section_name)
             for key, translations in section_data.items():
                 for lang, value in translations.items():
-                    section.add_key(key, lang, value)
+                    section.add_key(key, languages.setdefault(lang, lang), value)
         return trans_data
\ No newline at end of file
@@ -1,18 +1,137 @@
 """Main synchronization class for iOS i18n."""
 
+import functools
+import hashlib
+import io
+import itertools
+import os
 import plistlib
 import re
+import sys
+import xml.etree.ElementTree as ElementTree
 import yaml
 from pathlib import Path
-from typing import Optional, Set
+from types import MappingProxyType
+from typing import List, Optional, Set, Tuple
+
+from .models import TranslationKey, TranslationsData, sort_languages
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader
+
+# Tokenizes a .strings file in one pass: /* */ and // comments are consumed
+# whole (their groups are empty), so commented-out entries are skipped, and
+# "key" = "value"; entries capture key and raw value. The value is written as
+# an unrolled loop so runs of plain characters are consumed in one step
+# instead of one alternation per character.
+_STRINGS_RE = re.compile(
+    r'/\*.*?\*/|//[^\n]*|"([^"]+)"\s*=\s*"([^"\\]*(?:\\.[^"\\]*)*)";',
+    re.DOTALL,
+)
+# Escape sequences in .strings values, resolved on extract and re-created on
+# apply. Other backslash sequences (e.g. \U00A0) are kept as-is in both
+# directions, so they survive extract -> apply unchanged.
+_STRINGS_UNESCAPES = {'\\': '\\', '"': '"', "'": "'", 'n': '\n', 'r': '\r', 't': '\t'}
+_STRINGS_UNESCAPE_RE = re.compile(r'\\([\\"\'nrt])')
+# A backslash is doubled only where extract would otherwise read it as the start
+# of one of the escapes above: before one of those characters, before a
+# character that is itself escaped below, or at the end of the value
+_STRINGS_ESCAPE_BACKSLASH_RE = re.compile(r'\\(?=[\\"\'nrt\n\r\t]|\Z)')
+_STRINGS_ESCAPE_TABLE = str.maketrans({
+    '"': '\\"',
+    '\n': '\\n',
+    '\r': '\\r',
+    '\t': '\\t',
+})
+_STRINGS_ESCAPE_CHARS_RE = re.compile(r'[\\"\n\r\t]')
+# A "key" = entry at the start of a line; everything before the first one is
+# the file header
+_FIRST_KV_RE = re.compile(rb'"[^"]+"\s*=')
+
+# Plural variable in NSStringLocalizedFormatKey: %#@varname@ or %N$#@varname@
+_PLURAL_VAR_RE = re.compile(r'%(?:\d+\$)?#@(\w+)@')
+_PLURAL_PLACEHOLDER_RE = re.compile(r'%#@\w+@')
+
+# Already-positional iOS object specifiers: %1$@
+_POSITIONAL_OBJECT_RE = re.compile(r'(%\d+\$)@')
+# Non-positional format specifiers (excluding %%)
+# Matches: %@, %d, %f, %.2f, %ld, etc. but not already positional like %1$d
+_FORMAT_SPECIFIER_RE = re.compile(r'%(?!\d+\$)(\.\d+)?(@|[dfiulxXoOeEgGsScCpPaAbBhHnN]|l[diu])')
+
+# Android strings.xml escaping, applied in a single pass. aapt collapses real
+# newlines and tabs, so they are written as escapes. Backslashes are not
+# escaped: a literal \n typed in YAML keeps working.
+_ANDROID_ESCAPE_TABLE = str.maketrans({
+    '&': '&amp;',
+    '<': '&lt;',
+    '>': '&gt;',
+    "'": "\\'",
+    '"': '\\"',
+    '\n': '\\n',
+    '\t': '\\t',
+})
+_ANDROID_ESCAPE_CHARS_RE = re.compile(r'[&<>\'"\n\t]')
+
+# Keep the pure-Python emitter: libyaml escapes emoji and other non-BMP
+# characters ("\U0001F600"), which makes the YAML unreadable.
+_YAML_DUMP_OPTIONS = {
+    "default_flow_style": False,
+    "allow_unicode": True,
+    "sort_keys": False,
+    "width": 120,
+}
 
-from .models import TranslationsData
+# Conservative subset of strings PyYAML writes as plain (unquoted) scalars:
+# starts with a letter or digit, no ':', '#', quotes at the start, flow
+# collection indicators or trailing space. Implicit resolution (e.g. "no",
+# "1.0", "null") is checked separately with the resolver.
+_PLAIN_SCALAR_RE = re.compile(r"[^\W_][\w .,!?()/'+-]*(?<! )")
+_YAML_RESOLVER = yaml.resolver.Resolver()
+# yaml.dump writes a key as a complex "? key" entry unless its length plus
+# the length of its "!!str" tag stays under 128 (Emitter.check_simple_key)
+_YAML_MAX_SIMPLE_KEY_LENGTH = 128 - len("!!str")
+
+# Language names used in the default header of newly created .strings files
+_LANG_NAMES = {
+    'en': 'English',
+    'es': 'Spanish',
+    'es-419': 'Spanish (Latin America)',
+    'es-MX': 'Spanish (Mexico)',
+    'fr': 'French',
+    'de': 'German',
+    'it': 'Italian',
+    'nl': 'Dutch',
+    'pt-PT': 'Portuguese (Portugal)',
+    'pt-BR': 'Portuguese (Brazil)',
+    'sv': 'Swedish',
+    'nb': 'Norwegian Bokmål',
+    'da': 'Danish',
+    'fi': 'Finnish',
+    'pl': 'Polish',
+    'el': 'Greek',
+    'ru': 'Russian',
+    'uk': 'Ukrainian',
+    'sr': 'Serbian (Cyrillic)',
+    'sr-Latn': 'Serbian (Latin)',
+    'tr': 'Turkish',
+    'th': 'Thai',
+    'vi': 'Vietnamese',
+    'id': 'Indonesian',
+    'ja': 'Japanese',
+    'ko': 'Korean',
+    'zh-Hans': 'Chinese (Simplified)',
+    'zh-Hant': 'Chinese (Traditional)',
+    'zh-HK': 'Chinese (Hong Kong)',
+}
 
 
 # iOS to Android language code mapping
 # Full list for all App Store supported locales
 # See: https://developer.apple.com/help/app-store-connect/reference/app-store-localizations/
-IOS_TO_ANDROID_LANG = {
+# Read-only, since _IOS_TO_LOCALE below is derived from it at import time
+IOS_TO_ANDROID_LANG = MappingProxyType({
     # Chinese variants (use region format for locales_config.xml compatibility)
     "zh-Hans": "zh-rCN",       # Chinese Simplified
     "zh-Hant": "zh-rTW",       # Chinese Traditional
@@ -51,7 +170,166 @@ IOS_TO_ANDROID_LANG = {
 
     # Yiddish
     "yi": "ji",
-}
+})
+
+
+def _folder_to_locale(folder_code: str) -> str:
+    """Convert an Android resource folder qualifier to locale format.
+
+    - zh-rCN -> zh-CN (remove 'r' prefix from region)
+    - b+sr+Latn -> sr-Latn (BCP 47 to standard format)
+    """
+    if folder_code.startswith("b+"):
+        # BCP 47 format: b+sr+Latn -> sr-Latn
+        return "-".join(folder_code[2:].split("+"))
+    if "-r" in folder_code:
+        # Region format: zh-rCN -> zh-CN
+        return folder_code.replace("-r", "-")
+    return folder_code
+
+
+# iOS language code to locales_config.xml locale, derived once from IOS_TO_ANDROID_LANG
+_IOS_TO_LOCALE = {ios: _folder_to_locale(folder) for ios, folder in IOS_TO_ANDROID_LANG.items()}
+
+# iOS format type to Android; everything else (d, f, ld, ...) is unchanged
+_IOS_TO_ANDROID_TYPE = {'@': 's'}
+
+
+def _read_strings_entries(file_path: Path) -> List[Tuple[str, str]]:
+    """Read a .strings file and return its (key, raw value) pairs."""
+    data = file_path.read_bytes()
+    # Empty and comment-only files have no entries; a C-level byte search is
+    # much cheaper than decoding and running the regex over them
+    if b'=' not in data or b'"' not in data:
+        return []
+    return [(key, value) for key, value in _STRINGS_RE.findall(data.decode('utf-8')) if key]
+
+
+def _plist_element_to_python(element):
+    """Convert a <dict>/<string> plist element to Python objects.
+
+    Raises ValueError for any other element type.
+    """
+    if element.tag == 'string':
+        return element.text or ''
+    if element.tag == 'dict':
+        children = list(element)
+        if len(children) % 2 or any(child.tag != 'key' for child in children[::2]):
+            raise ValueError("malformed plist dict")
+        return {
+            key.text or '': _plist_element_to_python(value)
+            for key, value in zip(children[::2], children[1::2])
+        }
+    raise ValueError(f"unsupported plist element: {element.tag}")
+
+
+def _load_stringsdict(data: bytes) -> dict:
+    """Load a .stringsdict plist.
+
+    .stringsdict files only use <dict> and <string>, which ElementTree can
+    convert several times faster than plistlib's pure-Python handlers. Anything
+    else (binary plists, other value types, malformed XML) goes to plistlib.
+    """
+    # ElementTree expands entity declarations, which plistlib rejects as a
+    # safeguard against entity-expansion attacks. Only take the fast path for
+    # ASCII-compatible XML, where a declaration is visible as plain bytes.
+    if data.startswith((b'<?xml', b'\xef\xbb\xbf<?xml')) and b'<!ENTITY' not in data:
+        try:
+            root = ElementTree.fromstring(data)
+            if root.tag == 'plist' and len(root) == 1:
+                return _plist_element_to_python(root[0])
+        except (ElementTree.ParseError, ValueError):
+            pass
+    return plistlib.loads(data)
+
+
+def _find_header_end(data: bytes) -> int:
+    """Return the offset of the first "key" = line in `data`, or -1."""
+    if _FIRST_KV_RE.match(data):
+        return 0
+    # Entries start at column 0, so only lines beginning with a quote need the
+    # regex; bytes.find jumps straight to them
+    pos = data.find(b'\n"')
+    while pos >= 0:
+        if _FIRST_KV_RE.match(data, pos + 1):
+            return pos + 1
+        pos = data.find(b'\n"', pos + 1)
+    return -1
+
+
+def _is_plain_yaml_scalar(value) -> bool:
+    """Return True if yaml.dump would write `value` unquoted."""
+    return (
+        isinstance(value, str)
+        and _PLAIN_SCALAR_RE.fullmatch(value) is not None
+        and _YAML_RESOLVER.resolve(yaml.ScalarNode, value, (True, False)) == "tag:yaml.org,2002:str"
+    )
+
+
+def _format_plain_yaml_entry(key: str, translations: dict) -> Optional[str]:
+    """Render a `key: {lang: text}` section entry exactly as yaml.dump would.
+
+    Only handles entries where every scalar is plain and fits on one line;
+    returns None otherwise so the caller can fall back to yaml.dump.
+    """
+    if not translations or len(key) >= _YAML_MAX_SIMPLE_KEY_LENGTH or not _is_plain_yaml_scalar(key):
+        return None
+
+    lines = [f"  {key}:"]
+    for lang, text in translations.items():
+        line = f"    {lang}: {text}"
+        if len(line) > _YAML_DUMP_OPTIONS["width"] or not (
+                _is_plain_yaml_scalar(lang) and _is_plain_yaml_scalar(text)):
+            return None
+        lines.append(line)
+    lines.append("")
+    return "\n".join(lines)
+
+
+def _content_digest(content: bytes) -> bytes:
+    """Return a short digest identifying `content`."""
+    return hashlib.blake2b(content, digest_size=16).digest()
+
+
+def _read_if_exists(file_path: Path) -> Optional[bytes]:
+    try:
+        return file_path.read_bytes()
+    except FileNotFoundError:
+        return None
+
+
+def _write_bytes(file_path: Path, content: bytes) -> None:
+    """Write `content`, creating missing parent directories on first write."""
+    # Output directories almost always exist already, so try the write first
+    # instead of paying for a mkdir call before every file
+    try:
+        file_path.write_bytes(content)
+    except FileNotFoundError:
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_bytes(content)
+
+
+def _write_if_changed(file_path: Path, content: bytes) -> bool:
+    """Write `content` unless the file already holds exactly these bytes.
+
+    Leaving unchanged files untouched keeps their mtime, so Xcode and Gradle
+    don't rebuild resources after a no-op apply. Returns True if written.
+    """
+    if _read_if_exists(file_path) == content:
+        return False
+    _write_bytes(file_path, content)
+    return True
+
+
+def _buffered_output(method):
+    """Collect messages logged while `method` runs and write them to stdout at once."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self._flush_log()
+    return wrapper
 
 
 class I18nSync:
@@ -73,11 +351,18 @@ class I18nSync:
         self.strings_files = ["Localizable", "InfoPlist"]
         self.translations = TranslationsData()
         self.plurals = {}  # {key: {lang: {quantity: value}}}
+        # YAML bytes this instance last saved or loaded; lets apply() after
+        # extract() reuse the in-memory data instead of parsing it again
+        # Digest of the YAML last saved or loaded, to skip re-parsing it
+        self._yaml_digest: Optional[bytes] = None
+        self._messages: List[str] = []
 
+    @_buffered_output
     def extract(self) -> None:
         """Extract all translations from .strings and .stringsdict files to YAML."""
         self.translations = TranslationsData()
         self.plurals = {}
+        self._yaml_digest = None
 
         for lproj_dir in self._get_lproj_directories():
             self._process_language_directory(lproj_dir)
@@ -87,7 +372,16 @@ class I18nSync:
         self._report_statistics()
 
     def _get_lproj_directories(self):
-        lproj_dirs = list(self.resources_path.glob("*.lproj"))
+        # os.scandir reuses the d_type from the directory listing, so unlike
+        # Path.glob it needs no pattern compile and no extra stat per entry
+        try:
+            with os.scandir(self.resources_path) as entries:
+                lproj_dirs = [
+                    Path(entry.path) for entry in entries
+                    if entry.name.endswith(".lproj") and entry.is_dir()
+                ]
+        except (FileNotFoundError, NotADirectoryError):
+            lproj_dirs = []
         if not lproj_dirs:
             raise FileNotFoundError(f"No *.lproj directories found in {self.resources_path}")
         return lproj_dirs
@@ -98,7 +392,7 @@ class I18nSync:
         for strings_file_name in self.strings_files:
             strings_file = lproj_dir / f"{strings_file_name}.strings"
             if strings_file.exists():
-                self._parse_strings_file(strings_file, lang, strings_file_name)
+                self._add_strings_entries(_read_strings_entries(strings_file), lang, strings_file_name)
 
             # Also check for stringsdict (plurals)
             stringsdict_file = lproj_dir / f"{strings_file_name}.stringsdict"
@@ -120,6 +414,7 @@ class I18nSync:
             for key in dead_keys:
                 del section.keys[key]
 
+    @_buffered_output
     def apply(self) -> None:
         """Apply translations from YAML to .strings and .stringsdict files."""
         if not self.yaml_path.exists():
@@ -139,22 +434,22 @@ class I18nSync:
         if self.plurals:
             self._apply_stringsdict(languages)
 
-        print(f"Applied translations to {len(languages)} languages")
+        self._log(f"Applied translations to {len(languages)} languages")
 
     def _apply_section(self, section_name: str, languages: Set[str]) -> None:
         section = self.translations.sections.get(section_name)
         if not section:
             return
 
+        # Sort once per section, not once per language
+        sorted_keys = sorted(section.keys.items())
         for lang in languages:
-            self._write_section_to_language(section, lang)
+            self._write_section_to_language(section, lang, sorted_keys)
 
-    def _write_section_to_language(self, section, lang: str) -> None:
+    def _write_section_to_language(self, section, lang: str, sorted_keys: list) -> None:
         lproj_dir = self.resources_path / f"{lang}.lproj"
-        lproj_dir.mkdir(exist_ok=True, parents=True)
-
         strings_file = lproj_dir / f"{section.name}.strings"
-        self._write_strings_file(strings_file, lang, section)
+        self._write_strings_file(strings_file, lang, section, sorted_keys)
 
     def _apply_stringsdict(self, languages: Set[str]) -> None:
         """Write plurals from YAML to .stringsdict files for each language."""
@@ -173,18 +468,15 @@ class I18nSync:
                 continue
 
             lproj_dir = self.resources_path / f"{lang}.lproj"
-            lproj_dir.mkdir(exist_ok=True, parents=True)
-
             stringsdict_file = lproj_dir / "Localizable.stringsdict"
             self._write_stringsdict_file(stringsdict_file, lang_plurals)
 
     def _write_stringsdict_file(self, file_path: Path, lang_plurals: dict) -> None:
         """Write or merge plurals into an iOS .stringsdict plist file."""
-        # Load existing plist to preserve keys not in YAML
-        existing = {}
-        if file_path.exists():
-            with open(file_path, 'rb') as f:
-                existing = plistlib.load(f)
+        # Read the existing file once: its plist preserves keys not in YAML,
+        # and its bytes let us skip the write when nothing changed
+        existing_bytes = _read_if_exists(file_path)
+        existing = plistlib.loads(existing_bytes) if existing_bytes is not None else {}
 
         # Merge new plurals into existing
         for key, forms in lang_plurals.items():
@@ -192,7 +484,7 @@ class I18nSync:
 
             # Determine variable name and format key
             if format_key_value:
-                match = re.search(r'%(?:\d+\$)?#@(\w+)@', format_key_value)
+                match = _PLURAL_VAR_RE.search(format_key_value)
                 var_name = match.group(1) if match else "count"
             else:
                 var_name = "count"
@@ -213,26 +505,21 @@ class I18nSync:
             }
 
         # Write plist
-        with open(file_path, 'wb') as f:
-            plistlib.dump(existing, f, fmt=plistlib.FMT_XML)
+        content = plistlib.dumps(existing, fmt=plistlib.FMT_XML)
+        if content != existing_bytes:
+            _write_bytes(file_path, content)
+            self._log(f"Updated {file_path}")
 
-        print(f"Updated {file_path}")
-
-    def _parse_strings_file(self, file_path: Path, lang: str, section_name: str) -> None:
-        content = file_path.read_text(encoding='utf-8')
+    def _add_strings_entries(self, entries: List[Tuple[str, str]], lang: str, section_name: str) -> None:
         section = self.translations.add_section(section_name)
 
-        pattern = r'"([^"]+)"\s*=\s*"((?:[^"\\]|\\.)*)";\s*(?://.*)?'
-        for match in re.finditer(pattern, content):
-            key = match.group(1)
-            value_raw = match.group(2)
+        for key, value_raw in entries:
             value = self._unescape_strings_value(value_raw)
             section.add_key(key, lang, value)
 
     def _parse_stringsdict_file(self, file_path: Path, lang: str) -> None:
         """Parse iOS .stringsdict file and extract plurals."""
-        with open(file_path, 'rb') as f:
-            plist = plistlib.load(f)
+        plist = _load_stringsdict(file_path.read_bytes())
 
         # Each key in plist is a plural key
         for key, entry in plist.items():
@@ -242,7 +529,7 @@ class I18nSync:
             # Find the plural variable (e.g., "hours" in %#@hours@ or %2$#@hours@)
             format_key = entry.get("NSStringLocalizedFormatKey", "")
             # Extract variable name from %#@varname@ or %N$#@varname@
-            match = re.search(r'%(?:\d+\$)?#@(\w+)@', format_key)
+            match = _PLURAL_VAR_RE.search(format_key)
             if not match:
                 continue
 
@@ -259,27 +546,37 @@ class I18nSync:
                     plural_forms[quantity] = plural_dict[quantity]
 
             if plural_forms:
-                if key not in self.plurals:
-                    self.plurals[key] = {}
-
                 # Save _format_key inside plural_forms if it's more than just the placeholder
                 # e.g., "Only %#@texts@ available..." vs just "%#@texts@"
                 simple_placeholder = f"%#@{var_name}@"
                 if format_key != simple_placeholder:
                     plural_forms["_format_key"] = format_key
 
-                self.plurals[key][lang] = plural_forms
+                self.plurals.setdefault(key, {})[lang] = plural_forms
 
     def _unescape_strings_value(self, value: str) -> str:
-        return value.replace('\\"', '"').replace('\\\\', '\\')
+        if '\\' not in value:
+            return value
+        return _STRINGS_UNESCAPE_RE.sub(lambda m: _STRINGS_UNESCAPES[m.group(1)], value)
 
     def _escape_strings_value(self, value: str) -> str:
-        return value.replace('\\', '\\\\').replace('"', '\\"')
+        # Most values need no escaping, and str.translate is slow on non-ASCII text
+        if not _STRINGS_ESCAPE_CHARS_RE.search(value):
+            return value
+        if '\\' in value:
+            value = _STRINGS_ESCAPE_BACKSLASH_RE.sub(r'\\\\', value)
+        return value.translate(_STRINGS_ESCAPE_TABLE)
+
+    def _write_strings_file(self, file_path: Path, lang: str, section, sorted_keys: list) -> None:
+        """Write translations to a .strings file.
 
-    def _write_strings_file(self, file_path: Path, lang: str, section) -> None:
-        """Write translations to a .strings file."""
-        # Get header if file exists
-        header = self._get_file_header(file_path, lang, section.name)
+        `sorted_keys` holds the section's (key, TranslationKey) pairs in
+        alphabetical order, shared across all languages.
+        """
+        # Read the existing file once: it provides the header and lets us skip
+        # the write when nothing changed
+        existing = _read_if_exists(file_path)
+        header = self._get_file_header(existing, lang, section.name)
 
         # Build content
         lines = []
@@ -287,8 +584,7 @@ class I18nSync:
             lines.append(header)
 
         # Write keys sorted alphabetically
-        for key in sorted(section.keys.keys()):
-            trans_key = section.keys[key]
+        for key, trans_key in sorted_keys:
             value = trans_key.get_translation(lang)
             if value is not None:
                 escaped_value = self._escape_strings_value(value)
@@ -296,61 +592,31 @@ class I18nSync:
             else:
                 # Add empty value for missing translation
                 lines.append(f'"{key}" = "";')
-                print(f"Warning: Missing '{section.name}.{key}' for language '{lang}'")
-
-        # Write file
-        content = '\n'.join(lines)
-        if content and not content.endswith('\n'):
-            content += '\n'
-
-        file_path.write_text(content, encoding='utf-8')
-        print(f"Updated {file_path}")
-
-    def _get_file_header(self, file_path: Path, lang: str, file_type: str) -> Optional[str]:
-        """Extract header comment from existing file or create default."""
-        if file_path.exists():
-            content = file_path.read_text(encoding='utf-8')
-            # Extract everything before first "key" = "value" line
-            match = re.search(r'^"[^"]+"\s*=', content, re.MULTILINE)
-            if match:
-                header = content[:match.start()].rstrip()
+                self._log(f"Warning: Missing '{section.name}.{key}' for language '{lang}'")
+
+        # Write file. No line ends with a newline, so joining an empty last
+        # element adds the trailing one without copying the whole content again.
+        if lines:
+            lines.append('')
+        content = '\n'.join(lines).encode('utf-8')
+
+        if content != existing:
+            _write_bytes(file_path, content)
+            self._log(f"Updated {file_path}")
+
+    def _get_file_header(self, existing: Optional[bytes], lang: str, file_type: str) -> Optional[str]:
+        """Extract header comment from existing file content or create default."""
+        if existing is not None:
+            # Extract everything before first "key" = "value" line; only the
+            # header itself needs decoding, not the entries after it
+            header_end = _find_header_end(existing)
+            if header_end >= 0:
+                header = existing[:header_end].decode('utf-8').rstrip()
                 if header:
                     return header
 
         # Default header with better language names
-        lang_names = {
-            'en': 'English',
-            'es': 'Spanish',
-            'es-419': 'Spanish (Latin America)',
-            'es-MX': 'Spanish (Mexico)',
-            'fr': 'French',
-            'de': 'German',
-            'it': 'Italian',
-            'nl': 'Dutch',
-            'pt-PT': 'Portuguese (Portugal)',
-            'pt-BR': 'Portuguese (Brazil)',
-            'sv': 'Swedish',
-            'nb': 'Norwegian Bokmål',
-            'da': 'Danish',
-            'fi': 'Finnish',
-            'pl': 'Polish',
-            'el': 'Greek',
-            'ru': 'Russian',
-            'uk': 'Ukrainian',
-            'sr': 'Serbian (Cyrillic)',
-            'sr-Latn': 'Serbian (Latin)',
-            'tr': 'Turkish',
-            'th': 'Thai',
-            'vi': 'Vietnamese',
-            'id': 'Indonesian',
-            'ja': 'Japanese',
-            'ko': 'Korean',
-            'zh-Hans': 'Chinese (Simplified)',
-            'zh-Hant': 'Chinese (Traditional)',
-            'zh-HK': 'Chinese (Hong Kong)'
-        }
-
-        lang_name = lang_names.get(lang, lang)
+        lang_name = _LANG_NAMES.get(lang, lang)
         return f"""/*
   {file_type}.strings
   QRServe
@@ -360,70 +626,116 @@ class I18nSync:
 
     def _save_yaml(self) -> None:
         """Save translations to YAML file."""
-        data = self.translations.to_yaml_dict()
-
-        # Add plurals section if we have any
-        if self.plurals:
-            plurals_data = {}
-            for key in sorted(self.plurals.keys()):
-                plurals_data[key] = {}
-                langs = self.plurals[key]
-                # Sort with 'en' first
-                if 'en' in langs:
-                    plurals_data[key]['en'] = langs['en']
-                for lang in sorted(langs.keys()):
-                    if lang != 'en':
-                        plurals_data[key][lang] = langs[lang]
-            data["Plurals"] = plurals_data
-
-        with open(self.yaml_path, 'w', encoding='utf-8') as f:
-            yaml.dump(data, f,
-                     default_flow_style=False,
-                     allow_unicode=True,
-                     sort_keys=False,
-                     width=120)
-
-        print(f"Saved translations to {self.yaml_path}")
+        with io.StringIO() as f:
+            for section_name, section in self.translations.sections.items():
+                entries = ((key, sort_languages(trans_key.translations))
+                           for key, trans_key in section.keys.items())
+                self._dump_yaml_section(f, section_name, entries)
+
+            # Add plurals section if we have any
+            if self.plurals:
+                entries = ((key, sort_languages(self.plurals[key]))
+                           for key in sorted(self.plurals.keys()))
+                self._dump_yaml_section(f, "Plurals", entries)
+
+            # Nothing extracted: write what yaml.dump gives for an empty dict
+            if not self.translations.sections and not self.plurals:
+                yaml.dump({}, f, **_YAML_DUMP_OPTIONS)
+
+            content = f.getvalue().encode('utf-8')
+
+        _write_if_changed(self.yaml_path, content)
+        self._yaml_digest = _content_digest(content)
+        self._log(f"Saved translations to {self.yaml_path}")
+
+    def _dump_yaml_section(self, f, section_name: str, entries) -> None:
+        """Write one top-level YAML section, dumping a single key at a time.
+
+        Each key is dumped nested under its section name so indentation and line
+        wrapping match one yaml.dump of the whole file, but only one key's node
+        graph is held in memory at a time. Flat entries made only of plain
+        scalars are formatted directly, skipping PyYAML altogether.
+        """
+        fast_path = _is_plain_yaml_scalar(section_name)
+        written = False
+        for key, value in entries:
+            chunk = _format_plain_yaml_entry(key, value) if fast_path else None
+            if chunk is None:
+                chunk = yaml.dump({section_name: {key: value}}, **_YAML_DUMP_OPTIONS)
+                if written:
+                    # Drop the repeated "<section_name>:" line
+                    chunk = chunk.split('\n', 1)[1]
+            elif not written:
+                chunk = f"{section_name}:\n{chunk}"
+            f.write(chunk)
+            written = True
+
+        if not written:
+            yaml.dump({section_name: {}}, f, **_YAML_DUMP_OPTIONS)
 
     def _load_yaml(self) -> None:
-        """Load translations from YAML file."""
-        with open(self.yaml_path, 'r', encoding='utf-8') as f:
-            data = yaml.safe_load(f) or {}
+        """Load translations from YAML file.
+
+        Skips parsing when the file still holds exactly what this instance
+        last saved or loaded, since self.translations already matches it.
+        """
+        content = self.yaml_path.read_bytes()
+        digest = _content_digest(content)
+        if digest == self._yaml_digest:
+            return
+
+        # PyYAML decodes bytes itself, so no second, decoded copy is made here
+        data = yaml.load(content, Loader=SafeLoader) or {}
 
         # Extract plurals section before creating TranslationsData
         self.plurals = data.pop("Plurals", {})
 
         self.translations = TranslationsData.from_yaml_dict(data)
+        self._yaml_digest = digest
 
     def _report_statistics(self) -> None:
         """Report extraction statistics and missing keys."""
         total_keys = 0
         languages = self.translations.get_all_languages()
 
-        print("\nExtraction summary:")
+        self._log("\nExtraction summary:")
         for section_name, section in self.translations.sections.items():
             key_count = len(section.keys)
             total_keys += key_count
-            print(f"  {section_name}: {key_count} keys")
+            self._log(f"  {section_name}: {key_count} keys")
 
-        print(f"\nTotal: {total_keys} keys from {len(languages)} languages")
+        self._log(f"\nTotal: {total_keys} keys from {len(languages)} languages")
 
-        # Check for missing translations
+        # Check for missing translations. Every key's languages are a subset of
+        # `languages`, so a key with as many translations as there are languages
+        # is complete and needs no set difference.
+        language_count = len(languages)
         missing_found = False
         for section_name, section in self.translations.sections.items():
             for key, trans_key in section.keys.items():
-                missing_langs = languages - set(trans_key.translations.keys())
-                if missing_langs:
-                    if not missing_found:
-                        print("\nMissing translations:")
-                        missing_found = True
-                    print(f"  {section_name}.{key}: missing in {', '.join(sorted(missing_langs))}")
+                if len(trans_key.translations) == language_count:
+                    continue
+                missing_langs = languages.difference(trans_key.translations)
+                if not missing_found:
+                    self._log("\nMissing translations:")
+                    missing_found = True
+                self._log(f"  {section_name}.{key}: missing in {', '.join(sorted(missing_langs))}")
 
         if not missing_found:
-            print("\nAll keys present in all languages ✓")
+            self._log("\nAll keys present in all languages ✓")
+
+    def _log(self, message: str) -> None:
+        """Queue a line of output; it is written when the public call returns."""
+        self._messages.append(message)
+
+    def _flush_log(self) -> None:
+        if self._messages:
+            sys.stdout.write("\n".join(self._messages) + "\n")
+            self._messages.clear()
 
     # ==================== Android support ====================
 
+    @_buffered_output
     def apply_android(self, res_path: str = "app/src/main/res", default_lang: str = "en") -> None:
         """Apply translations from YAML to Android strings.xml files."""
         if not self.yaml_path.exists():
@@ -437,15 +749,32 @@ class I18nSync:
         for plural_key, lang_data in self.plurals.items():
             languages.update(lang_data.keys())
 
+        # Key order is the same for every language, so sort once up front.
+        # Keys are collected per section in order; a later section's value
+        # wins when it has a translation for the language.
+        string_keys = {}
+        for section in self.translations.sections.values():
+            for key, trans_key in section.keys.items():
+                string_keys.setdefault(key, []).append(trans_key)
+        sorted_string_keys = sorted(string_keys.items())
+        sorted_plural_keys = sorted(self.plurals)
+
         for lang in languages:
-            self._write_android_strings(res_path, lang, default_lang)
+            self._write_android_strings(res_path, lang, default_lang, sorted_string_keys, sorted_plural_keys)
 
         # Generate locales_config.xml for per-app language support
         self._write_locales_config(res_path, languages)
 
-        print(f"Applied translations to {len(languages)} Android languages")
+        self._log(f"Applied translations to {len(languages)} Android languages")
 
-    def _write_android_strings(self, res_path: Path, lang: str, default_lang: str) -> None:
+    def _write_android_strings(
+        self,
+        res_path: Path,
+        lang: str,
+        default_lang: str,
+        sorted_string_keys: List[Tuple[str, List[TranslationKey]]],
+        sorted_plural_keys: List[str],
+    ) -> None:
         """Write strings.xml for a specific language."""
         # Determine folder name
         if lang == default_lang:
@@ -454,32 +783,33 @@ class I18nSync:
             android_lang = IOS_TO_ANDROID_LANG.get(lang, lang)
             folder_name = f"values-{android_lang}"
 
-        values_dir = res_path / folder_name
-        values_dir.mkdir(parents=True, exist_ok=True)
-
-        strings_file = values_dir / "strings.xml"
-        self._write_android_xml(strings_file, lang)
+        strings_file = res_path / folder_name / "strings.xml"
+        self._write_android_xml(strings_file, lang, sorted_string_keys, sorted_plural_keys)
 
-    def _write_android_xml(self, file_path: Path, lang: str) -> None:
+    def _write_android_xml(
+        self,
+        file_path: Path,
+        lang: str,
+        sorted_string_keys: List[Tuple[str, List[TranslationKey]]],
+        sorted_plural_keys: List[str],
+    ) -> None:
         """Write Android strings.xml file."""
         lines = ['<?xml version="1.0" encoding="utf-8"?>', "<resources>"]
 
-        # Collect all keys from all sections for this language
-        all_keys = {}
-        for section in self.translations.sections.values():
-            for key, trans_key in section.keys.items():
+        # Write string keys sorted alphabetically
+        for key, trans_keys in sorted_string_keys:
+            value = None
+            for trans_key in reversed(trans_keys):
                 value = trans_key.get_translation(lang)
                 if value is not None:
-                    all_keys[key] = value
-
-        # Write string keys sorted alphabetically
-        for key in sorted(all_keys.keys()):
-            value = all_keys[key]
+                    break
+            if value is None:
+                continue
             escaped_value = self._escape_android_xml(value)
             lines.append(f'    <string name="{key}">{escaped_value}</string>')
 
         # Write plurals for this language
-        for plural_key in sorted(self.plurals.keys()):
+        for plural_key in sorted_plural_keys:
             lang_data = self.plurals[plural_key]
             if lang in lang_data:
                 forms = lang_data[lang]
@@ -492,7 +822,7 @@ class I18nSync:
                         # If _format_key exists, substitute the plural form into it
                         if format_key:
                             # Replace %#@varname@ with the plural value
-                            full_value = re.sub(r'%#@\w+@', plural_value, format_key)
+                            full_value = _PLURAL_PLACEHOLDER_RE.sub(plural_value, format_key)
                         else:
                             full_value = plural_value
                         escaped_value = self._escape_android_xml(full_value)
@@ -500,22 +830,19 @@ class I18nSync:
                 lines.append('    </plurals>')
 
         lines.append("</resources>")
+        lines.append("")
 
-        content = "\n".join(lines) + "\n"
-        file_path.write_text(content, encoding="utf-8")
-        print(f"Updated {file_path}")
+        content = "\n".join(lines).encode("utf-8")
+        if _write_if_changed(file_path, content):
+            self._log(f"Updated {file_path}")
 
     def _escape_android_xml(self, value: str) -> str:
         """Escape special characters for Android XML."""
         # Convert iOS format specifiers to Android
         value = self._convert_format_specifiers(value)
-        # Order matters: ampersand first
-        value = value.replace("&", "&amp;")
-        value = value.replace("<", "&lt;")
-        value = value.replace(">", "&gt;")
-        value = value.replace("'", "\\'")
-        value = value.replace('"', '\\"')
-        return value
+        if not _ANDROID_ESCAPE_CHARS_RE.search(value):
+            return value
+        return value.translate(_ANDROID_ESCAPE_TABLE)
 
     def _convert_format_specifiers(self, value: str) -> str:
         """Convert iOS format specifiers to Android format.
@@ -524,49 +851,32 @@ class I18nSync:
         - Multiple specifiers get positional args: %d %d -> %1$d %2$d
         - Already positional specifiers: %1$@ -> %1$s (convert type only)
         """
-        # First, convert already-positional iOS specifiers: %1$@ -> %1$s
-        value = re.sub(r'(%\d+\$)@', r'\1s', value)
-
-        # Pattern to match non-positional format specifiers (excluding %%)
-        # Matches: %@, %d, %f, %.2f, %ld, etc. but not already positional like %1$d
-        pattern = r'%(?!\d+\$)(\.\d+)?(@|[dfiulxXoOeEgGsScCpPaAbBhHnN]|l[diu])'
+        if '%' not in value:
+            return value
 
-        # First, find all format specifiers
-        matches = list(re.finditer(pattern, value))
+        # First, convert already-positional iOS specifiers: %1$@ -> %1$s
+        value = _POSITIONAL_OBJECT_RE.sub(r'\1s', value)
 
-        if not matches:
+        # Count non-positional format specifiers
+        specifier_count = len(_FORMAT_SPECIFIER_RE.findall(value))
+        if not specifier_count:
             return value
 
-        # If only one specifier, just convert %@ to %s without positional
-        if len(matches) == 1:
-            return re.sub(pattern, lambda m: f'%{m.group(1) or ""}{self._ios_to_android_type(m.group(2))}', value)
+        # A single specifier only gets its type converted (%@ -> %s); multiple
+        # specifiers also get positional arguments, numbered in one sub() pass
+        positions = itertools.count(1)
 
-        # Multiple specifiers: add positional arguments
-        result = value
-        offset = 0
-        for i, match in enumerate(matches, 1):
-            start = match.start() + offset
-            end = match.end() + offset
+        def replace(match):
+            position = f'{next(positions)}$' if specifier_count > 1 else ''
             precision = match.group(1) or ""
-            type_spec = self._ios_to_android_type(match.group(2))
-            replacement = f'%{i}${precision}{type_spec}'
-            result = result[:start] + replacement + result[end:]
-            offset += len(replacement) - (match.end() - match.start())
+            ios_type = match.group(2)
+            return f'%{position}{precision}{_IOS_TO_ANDROID_TYPE.get(ios_type, ios_type)}'
 
-        return result
-
-    def _ios_to_android_type(self, ios_type: str) -> str:
-        """Convert iOS type specifier to Android."""
-        if ios_type == '@':
-            return 's'
-        return ios_type
+        return _FORMAT_SPECIFIER_RE.sub(replace, value)
 
     def _write_locales_config(self, res_path: Path, languages: Set[str]) -> None:
         """Generate locales_config.xml for Android per-app language support."""
-        xml_dir = res_path / "xml"
-        xml_dir.mkdir(parents=True, exist_ok=True)
-
-        config_file = xml_dir / "locales_config.xml"
+        config_file = res_path / "xml" / "locales_config.xml"
 
         # Convert iOS language codes to Android format for locales_config
         android_locales = set()
@@ -583,28 +893,13 @@ class I18nSync:
             lines.append(f'    <locale android:name="{locale}" />')
 
         lines.append('</locale-config>')
+        lines.append('')
 
-        content = '\n'.join(lines) + '\n'
-        config_file.write_text(content, encoding='utf-8')
-        print(f"Generated {config_file}")
+        content = '\n'.join(lines).encode('utf-8')
+        if _write_if_changed(config_file, content):
+            self._log(f"Generated {config_file}")
 
     def _ios_to_android_locale(self, ios_lang: str) -> str:
-        """Convert iOS language code to Android locale format for locales_config.xml.
-
-        Derives from IOS_TO_ANDROID_LANG but converts folder format to locale format:
-        - values-zh-rCN -> zh-CN (remove 'r' prefix from region)
-        - values-b+sr+Latn -> sr-Latn (BCP 47 to standard format)
-        """
-        # Get the folder-style mapping first
-        folder_code = IOS_TO_ANDROID_LANG.get(ios_lang, ios_lang)
-
-        # Convert folder format to locale format
-        if folder_code.startswith("b+"):
-            # BCP 47 format: b+sr+Latn -> sr-Latn
-            parts = folder_code[2:].split("+")
-            return "-".join(parts)
-        elif "-r" in folder_code:
-            # Region format: zh-rCN -> zh-CN
-            return folder_code.replace("-r", "-")
-        else:
-            return folder_code
\ No newline at end of file
+        """Convert iOS language code to Android locale format for locales_config.xml."""
+        locale = _IOS_TO_LOCALE.get(ios_lang)
+        return locale if locale is not None else _folder_to_locale(ios_lang)
\ No newline at end of file
@@ -27,7 +27,6 @@ setup(
     install_requires=[
         "PyYAML>=6.0",
         "click>=8.0",
-        "pydantic>=2.0",
     ],
     entry_points={
         "console_scripts": [
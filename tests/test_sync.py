@@ -1,26 +1,17 @@
 """Tests for I18nSync class."""
 
+import re
+
 import pytest
-import tempfile
-import shutil
-from pathlib import Path
 import yaml
 from i18n_sync import I18nSync
 from i18n_sync.models import TranslationsData
 
 
 @pytest.fixture
-def temp_dir():
-    """Create a temporary directory for testing."""
-    temp = tempfile.mkdtemp()
-    yield Path(temp)
-    shutil.rmtree(temp)
-
-
-@pytest.fixture
-def sample_resources(temp_dir):
+def sample_resources(tmp_path):
     """Create sample .strings files for testing."""
-    resources = temp_dir / "Resources"
+    resources = tmp_path / "Resources"
     
     # English
     en_dir = resources / "en.lproj"
@@ -70,9 +61,9 @@ def sample_resources(temp_dir):
 class TestExtract:
     """Test extraction from .strings to YAML."""
 
-    def test_extract_escaped_quotes(self, temp_dir):
+    def test_extract_escaped_quotes(self, tmp_path):
         """Test that escaped quotes inside strings are properly extracted."""
-        resources = temp_dir / "Resources"
+        resources = tmp_path / "Resources"
         en_dir = resources / "en.lproj"
         en_dir.mkdir(parents=True)
         # String with escaped quotes inside
@@ -85,7 +76,7 @@ class TestExtract:
 "reportPrevious" = "Report previous \\"%@\\"";
 """, encoding='utf-8')
 
-        yaml_path = temp_dir / "translations.yaml"
+        yaml_path = tmp_path / "translations.yaml"
         sync = I18nSync(resources_path=resources, yaml_path=yaml_path)
         sync.extract()
 
@@ -98,9 +89,9 @@ class TestExtract:
         assert "reportPrevious" in data["Localizable"]
         assert data["Localizable"]["reportPrevious"]["en"] == 'Report previous "%@"'
 
-    def test_extract_basic(self, sample_resources, temp_dir):
+    def test_extract_basic(self, sample_resources, tmp_path):
         """Test basic extraction functionality."""
-        yaml_path = temp_dir / "translations.yaml"
+        yaml_path = tmp_path / "translations.yaml"
         sync = I18nSync(resources_path=sample_resources, yaml_path=yaml_path)
         
         sync.extract()
@@ -126,23 +117,35 @@ class TestExtract:
         assert data["Localizable"]["delete"]["de"] == "Löschen"
         # Russian is missing delete key
         assert "ru" not in data["Localizable"]["delete"]
-    
-    def test_extract_no_resources(self, temp_dir):
+
+    def test_extract_reports_missing_translations(self, sample_resources, tmp_path, capsys):
+        """Test that the summary lists only keys missing in some language."""
+        yaml_path = tmp_path / "translations.yaml"
+        sync = I18nSync(resources_path=sample_resources, yaml_path=yaml_path)
+
+        sync.extract()
+
+        output = capsys.readouterr().out
+        assert "Missing translations:" in output
+        assert "Localizable.delete: missing in ru" in output
+        assert "Localizable.cancel" not in output
+
+    def test_extract_no_resources(self, tmp_path):
         """Test extraction fails gracefully when no resources found."""
-        yaml_path = temp_dir / "translations.yaml"
-        sync = I18nSync(resources_path=temp_dir / "nonexistent", yaml_path=yaml_path)
+        yaml_path = tmp_path / "translations.yaml"
+        sync = I18nSync(resources_path=tmp_path / "nonexistent", yaml_path=yaml_path)
         
-        with pytest.raises(FileNotFoundError):
+        with pytest.raises(FileNotFoundError, match=r"No \*\.lproj directories found"):
             sync.extract()
     
-    def test_extract_empty_strings_file(self, temp_dir):
+    def test_extract_empty_strings_file(self, tmp_path):
         """Test extraction handles empty .strings files."""
-        resources = temp_dir / "Resources"
+        resources = tmp_path / "Resources"
         en_dir = resources / "en.lproj"
         en_dir.mkdir(parents=True)
         (en_dir / "Localizable.strings").write_text("", encoding='utf-8')
         
-        yaml_path = temp_dir / "translations.yaml"
+        yaml_path = tmp_path / "translations.yaml"
         sync = I18nSync(resources_path=resources, yaml_path=yaml_path)
         
         sync.extract()
@@ -153,13 +156,120 @@ class TestExtract:
         
         assert data == {"Localizable": {}} or data is None
 
+    def test_extract_empty_lproj_writes_empty_mapping(self, tmp_path):
+        """Test extraction from a language folder without files writes an empty mapping."""
+        resources = tmp_path / "Resources"
+        (resources / "en.lproj").mkdir(parents=True)
+
+        yaml_path = tmp_path / "translations.yaml"
+        sync = I18nSync(resources_path=resources, yaml_path=yaml_path)
+
+        sync.extract()
+
+        assert yaml_path.read_text(encoding='utf-8') == "{}\n"
+
+    def test_extract_escaped_backslashes_and_comments(self, tmp_path):
+        """Test values ending in an escaped backslash, and that commented-out entries are skipped."""
+        resources = tmp_path / "Resources"
+        en_dir = resources / "en.lproj"
+        en_dir.mkdir(parents=True)
+        (en_dir / "Localizable.strings").write_text(
+            '"path" = "C:\\\\";\n'
+            '"mixed" = "a \\\\\\"b\\\\\\" c"; // "commented" = "out";\n'
+            '/* "blockCommented" = "out";\n   "alsoCommented" = "out"; */\n'
+            '"url" = "https://example.com";\n',
+            encoding='utf-8'
+        )
+
+        yaml_path = tmp_path / "translations.yaml"
+        sync = I18nSync(resources_path=resources, yaml_path=yaml_path)
+
+        sync.extract()
+
+        with open(yaml_path, 'r', encoding='utf-8') as f:
+            data = yaml.safe_load(f)
+
+        assert data["Localizable"]["path"]["en"] == "C:\\"
+        assert data["Localizable"]["mixed"]["en"] == 'a \\"b\\" c'
+        assert "commented" not in data["Localizable"]
+        assert "blockCommented" not in data["Localizable"]
+        assert "alsoCommented" not in data["Localizable"]
+        assert data["Localizable"]["url"]["en"] == "https://example.com"
+
+    def test_extract_yaml_matches_single_dump(self, tmp_path):
+        """Test that the key-by-key YAML writer matches dumping the whole dict at once."""
+        resources = tmp_path / "Resources"
+        long_value = "A long sentence that has to be wrapped by the emitter. " * 4
+        for lang in ["en", "de"]:
+            lang_dir = resources / f"{lang}.lproj"
+            lang_dir.mkdir(parents=True)
+            (lang_dir / "Localizable.strings").write_text(
+                f'"long" = "{long_value}";\n"short" = "Short {lang}";\n'
+                '"flag" = "No";\n"label" = "Note: read";\n'
+                f'"{"k" * 122}" = "Key one below the limit";\n'
+                f'"{"k" * 123}" = "Key written as a complex entry";\n',
+                encoding='utf-8'
+            )
+            (lang_dir / "InfoPlist.strings").write_text("", encoding='utf-8')
+            (lang_dir / "Localizable.stringsdict").write_text("""<?xml version="1.0" encoding="UTF-8"?>
+<!DOCTYPE plist PUBLIC "-//Apple//DTD PLIST 1.0//EN" "http://www.apple.com/DTDs/PropertyList-1.0.dtd">
+<plist version="1.0">
+<dict>
+    <key>items</key>
+    <dict>
+        <key>NSStringLocalizedFormatKey</key>
+        <string>%#@count@</string>
+        <key>count</key>
+        <dict>
+            <key>NSStringFormatSpecTypeKey</key>
+            <string>NSStringPluralRuleType</string>
+            <key>NSStringFormatValueTypeKey</key>
+            <string>d</string>
+            <key>one</key>
+            <string>%d item</string>
+            <key>other</key>
+            <string>%d items</string>
+        </dict>
+    </dict>
+</dict>
+</plist>""", encoding='utf-8')
+
+        yaml_path = tmp_path / "translations.yaml"
+        sync = I18nSync(resources_path=resources, yaml_path=yaml_path)
+
+        sync.extract()
+
+        content = yaml_path.read_text(encoding='utf-8')
+        data = yaml.safe_load(content)
+        assert data["InfoPlist"] == {}
+        assert data["Plurals"]["items"]["en"]["one"] == "%d item"
+        expected = yaml.dump(data, default_flow_style=False, allow_unicode=True,
+                             sort_keys=False, width=120)
+        assert content == expected
+
+    def test_extract_keeps_emoji_readable(self, tmp_path):
+        """Test that emoji are written to YAML as-is, not as escape sequences."""
+        resources = tmp_path / "Resources"
+        en_dir = resources / "en.lproj"
+        en_dir.mkdir(parents=True)
+        (en_dir / "Localizable.strings").write_text('"done" = "Done 🎉";\n', encoding='utf-8')
+
+        yaml_path = tmp_path / "translations.yaml"
+        sync = I18nSync(resources_path=resources, yaml_path=yaml_path)
+
+        sync.extract()
+
+        content = yaml_path.read_text(encoding='utf-8')
+        assert "Done 🎉" in content
+        assert "\\U" not in content
+
 
 class TestApply:
     """Test applying YAML to .strings files."""
 
-    def test_apply_escapes_quotes(self, temp_dir):
+    def test_apply_escapes_quotes(self, tmp_path):
         """Test that quotes inside strings are properly escaped."""
-        yaml_path = temp_dir / "translations.yaml"
+        yaml_path = tmp_path / "translations.yaml"
 
         trans_data = TranslationsData()
         section = trans_data.add_section("Localizable")
@@ -172,7 +282,7 @@ class TestApply:
             yaml.dump(trans_data.to_yaml_dict(), f, allow_unicode=True, sort_keys=False)
 
         # Apply
-        resources = temp_dir / "Resources"
+        resources = tmp_path / "Resources"
         sync = I18nSync(resources_path=resources, yaml_path=yaml_path)
         sync.apply()
 
@@ -190,9 +300,9 @@ class TestApply:
         assert '"reportCurrent" = "Informar \\"%@\\"";' in content
         assert '"reportPrevious" = "Informar anterior \\"%@\\"";' in content
 
-    def test_apply_basic(self, temp_dir):
+    def test_apply_basic(self, tmp_path):
         """Test basic apply functionality."""
-        yaml_path = temp_dir / "translations.yaml"
+        yaml_path = tmp_path / "translations.yaml"
 
         trans_data = TranslationsData()
         section = trans_data.add_section("Localizable")
@@ -207,7 +317,7 @@ class TestApply:
             yaml.dump(trans_data.to_yaml_dict(), f, allow_unicode=True, sort_keys=False)
         
         # Apply
-        resources = temp_dir / "Resources"
+        resources = tmp_path / "Resources"
         sync = I18nSync(resources_path=resources, yaml_path=yaml_path)
         sync.apply()
         
@@ -231,10 +341,35 @@ class TestApply:
         content = de_file.read_text(encoding='utf-8')
         assert '"cancel" = "Abbrechen";' in content
         assert '"save" = "Speichern";' in content
-    
-    def test_apply_missing_translation(self, temp_dir):
+
+    def test_apply_skips_unchanged_files(self, tmp_path, capsys):
+        """Test that a second apply with the same YAML leaves files untouched."""
+        yaml_path = tmp_path / "translations.yaml"
+
+        trans_data = TranslationsData()
+        section = trans_data.add_section("Localizable")
+        section.add_key("cancel", "en", "Cancel")
+        section.add_key("cancel", "ru", "Отмена")
+
+        with open(yaml_path, 'w', encoding='utf-8') as f:
+            yaml.dump(trans_data.to_yaml_dict(), f, allow_unicode=True, sort_keys=False)
+
+        resources = tmp_path / "Resources"
+        sync = I18nSync(resources_path=resources, yaml_path=yaml_path)
+        sync.apply()
+        assert "Updated" in capsys.readouterr().out
+
+        en_file = resources / "en.lproj" / "Localizable.strings"
+        mtime_before = en_file.stat().st_mtime_ns
+
+        sync.apply()
+
+        assert "Updated" not in capsys.readouterr().out
+        assert en_file.stat().st_mtime_ns == mtime_before
+
+    def test_apply_missing_translation(self, tmp_path):
         """Test apply handles missing translations gracefully."""
-        yaml_path = temp_dir / "translations.yaml"
+        yaml_path = tmp_path / "translations.yaml"
 
         trans_data = TranslationsData()
         section = trans_data.add_section("Localizable")
@@ -248,7 +383,7 @@ class TestApply:
         with open(yaml_path, 'w', encoding='utf-8') as f:
             yaml.dump(trans_data.to_yaml_dict(), f, allow_unicode=True, sort_keys=False)
         
-        resources = temp_dir / "Resources"
+        resources = tmp_path / "Resources"
         sync = I18nSync(resources_path=resources, yaml_path=yaml_path)
         sync.apply()
         
@@ -259,22 +394,22 @@ class TestApply:
         assert '"cancel" = "Abbrechen";' in content
         assert '"save" = "";' in content  # Missing translation gets empty value
     
-    def test_apply_no_yaml(self, temp_dir):
+    def test_apply_no_yaml(self, tmp_path):
         """Test apply fails gracefully when YAML doesn't exist."""
-        resources = temp_dir / "Resources"
-        yaml_path = temp_dir / "nonexistent.yaml"
+        resources = tmp_path / "Resources"
+        yaml_path = tmp_path / "nonexistent.yaml"
         sync = I18nSync(resources_path=resources, yaml_path=yaml_path)
         
-        with pytest.raises(FileNotFoundError):
+        with pytest.raises(FileNotFoundError, match="YAML file not found"):
             sync.apply()
 
 
 class TestDeadKeyRemoval:
     """Test that keys missing from en (source of truth) are dropped."""
 
-    def test_extract_drops_keys_missing_from_en(self, temp_dir):
+    def test_extract_drops_keys_missing_from_en(self, tmp_path):
         """Keys that exist in other languages but NOT in en should be dropped during extract."""
-        resources = temp_dir / "Resources"
+        resources = tmp_path / "Resources"
 
         en_dir = resources / "en.lproj"
         en_dir.mkdir(parents=True)
@@ -289,7 +424,7 @@ class TestDeadKeyRemoval:
             encoding='utf-8',
         )
 
-        yaml_path = temp_dir / "translations.yaml"
+        yaml_path = tmp_path / "translations.yaml"
         sync = I18nSync(resources_path=resources, yaml_path=yaml_path)
         sync.extract()
 
@@ -300,9 +435,9 @@ class TestDeadKeyRemoval:
         assert "save" in data["Localizable"]
         assert "deadKey" not in data["Localizable"]
 
-    def test_round_trip_removes_deleted_keys(self, temp_dir):
+    def test_round_trip_removes_deleted_keys(self, tmp_path):
         """Extract -> apply removes keys from other languages if deleted from en."""
-        resources = temp_dir / "Resources"
+        resources = tmp_path / "Resources"
 
         en_dir = resources / "en.lproj"
         en_dir.mkdir(parents=True)
@@ -317,7 +452,7 @@ class TestDeadKeyRemoval:
             encoding='utf-8',
         )
 
-        yaml_path = temp_dir / "translations.yaml"
+        yaml_path = tmp_path / "translations.yaml"
         sync = I18nSync(resources_path=resources, yaml_path=yaml_path)
         sync.extract()
         sync.apply()
@@ -334,9 +469,9 @@ class TestDeadKeyRemoval:
 class TestRoundTrip:
     """Test extract -> apply round trip."""
 
-    def test_round_trip(self, sample_resources, temp_dir):
+    def test_round_trip(self, sample_resources, tmp_path):
         """Test that extract -> apply preserves data."""
-        yaml_path = temp_dir / "translations.yaml"
+        yaml_path = tmp_path / "translations.yaml"
         sync = I18nSync(resources_path=sample_resources, yaml_path=yaml_path)
         
         # Extract
@@ -365,13 +500,55 @@ class TestRoundTrip:
         assert '"cancel" = "Отмена";' in content
         assert '"save" = "Сохранить";' in content
 
+    def test_apply_after_extract_reuses_parsed_data(self, sample_resources, tmp_path, monkeypatch):
+        """Test that apply() on the same instance doesn't re-parse the YAML it just saved."""
+        yaml_path = tmp_path / "translations.yaml"
+        sync = I18nSync(resources_path=sample_resources, yaml_path=yaml_path)
+        sync.extract()
+
+        def fail_load(*args, **kwargs):
+            raise AssertionError("YAML was parsed again")
+
+        monkeypatch.setattr(yaml, "load", fail_load)
+        sync.apply()
+
+        de_file = sample_resources / "de.lproj" / "Localizable.strings"
+        assert '"delete" = "Löschen";' in de_file.read_text(encoding='utf-8')
+
+    def test_round_trip_escape_sequences(self, tmp_path):
+        """Test that \\n, \\t, \\", \\\\ and \\U00A0 survive extract -> apply unchanged."""
+        resources = tmp_path / "Resources"
+        en_dir = resources / "en.lproj"
+        en_dir.mkdir(parents=True)
+        entries = (
+            '"mixed" = "Say \\"hi\\" to C:\\\\";\n'
+            '"multiline" = "Line 1\\nLine 2\\tTabbed";\n'
+            '"nbsp" = "10\\U00A0km";\n'
+        )
+        (en_dir / "Localizable.strings").write_text(entries, encoding='utf-8')
+
+        yaml_path = tmp_path / "translations.yaml"
+        sync = I18nSync(resources_path=resources, yaml_path=yaml_path)
+        sync.extract()
+
+        with open(yaml_path, 'r', encoding='utf-8') as f:
+            data = yaml.safe_load(f)
+        assert data["Localizable"]["multiline"]["en"] == "Line 1\nLine 2\tTabbed"
+        assert data["Localizable"]["mixed"]["en"] == 'Say "hi" to C:\\'
+        assert data["Localizable"]["nbsp"]["en"] == "10\\U00A0km"
+
+        sync.apply()
+
+        content = (en_dir / "Localizable.strings").read_text(encoding='utf-8')
+        assert content.endswith(entries)
+
 
 class TestApplyAndroid:
     """Test applying YAML to Android strings.xml files."""
 
-    def test_apply_android_basic(self, temp_dir):
+    def test_apply_android_basic(self, tmp_path):
         """Test basic Android strings.xml generation."""
-        yaml_path = temp_dir / "translations.yaml"
+        yaml_path = tmp_path / "translations.yaml"
         yaml_data = {
             "Localizable": {
                 "cancel": {"en": "Cancel", "ru": "Отмена", "de": "Abbrechen"},
@@ -381,7 +558,7 @@ class TestApplyAndroid:
         with open(yaml_path, 'w', encoding='utf-8') as f:
             yaml.dump(yaml_data, f, allow_unicode=True)
 
-        res_path = temp_dir / "res"
+        res_path = tmp_path / "res"
         sync = I18nSync(yaml_path=yaml_path)
         sync.apply_android(res_path=res_path, default_lang="en")
 
@@ -407,9 +584,9 @@ class TestApplyAndroid:
         assert '<string name="cancel">Abbrechen</string>' in content
         assert '<string name="save">Speichern</string>' in content
 
-    def test_apply_android_language_mapping(self, temp_dir):
+    def test_apply_android_language_mapping(self, tmp_path):
         """Test iOS to Android language code mapping."""
-        yaml_path = temp_dir / "translations.yaml"
+        yaml_path = tmp_path / "translations.yaml"
         yaml_data = {
             "Localizable": {
                 "hello": {
@@ -429,7 +606,7 @@ class TestApplyAndroid:
         with open(yaml_path, 'w', encoding='utf-8') as f:
             yaml.dump(yaml_data, f, allow_unicode=True)
 
-        res_path = temp_dir / "res"
+        res_path = tmp_path / "res"
         sync = I18nSync(yaml_path=yaml_path)
         sync.apply_android(res_path=res_path, default_lang="en")
 
@@ -445,9 +622,9 @@ class TestApplyAndroid:
         assert (res_path / "values-b+sr+Latn" / "strings.xml").exists()  # sr-Latn
         assert (res_path / "values-nb" / "strings.xml").exists()  # nb stays nb
 
-    def test_apply_android_xml_escaping(self, temp_dir):
+    def test_apply_android_xml_escaping(self, tmp_path):
         """Test proper XML escaping in Android strings."""
-        yaml_path = temp_dir / "translations.yaml"
+        yaml_path = tmp_path / "translations.yaml"
         yaml_data = {
             "Localizable": {
                 "apostrophe": {"en": "It's working"},
@@ -455,12 +632,14 @@ class TestApplyAndroid:
                 "quotes": {"en": 'Say "Hello"'},
                 "less_than": {"en": "1 < 2"},
                 "greater_than": {"en": "2 > 1"},
+                "newline": {"en": "Line 1\nLine 2"},
+                "typed_newline": {"en": "Line 1\\nLine 2"},
             }
         }
         with open(yaml_path, 'w', encoding='utf-8') as f:
             yaml.dump(yaml_data, f, allow_unicode=True)
 
-        res_path = temp_dir / "res"
+        res_path = tmp_path / "res"
         sync = I18nSync(yaml_path=yaml_path)
         sync.apply_android(res_path=res_path, default_lang="en")
 
@@ -470,10 +649,12 @@ class TestApplyAndroid:
         assert '<string name="quotes">Say \\"Hello\\"</string>' in content
         assert "<string name=\"less_than\">1 &lt; 2</string>" in content
         assert "<string name=\"greater_than\">2 &gt; 1</string>" in content
+        assert '<string name="newline">Line 1\\nLine 2</string>' in content
+        assert '<string name="typed_newline">Line 1\\nLine 2</string>' in content
 
-    def test_apply_android_missing_translation(self, temp_dir):
+    def test_apply_android_missing_translation(self, tmp_path):
         """Test that missing translations are skipped (not included in that language file)."""
-        yaml_path = temp_dir / "translations.yaml"
+        yaml_path = tmp_path / "translations.yaml"
         yaml_data = {
             "Localizable": {
                 "cancel": {"en": "Cancel", "ru": "Отмена"},
@@ -483,7 +664,7 @@ class TestApplyAndroid:
         with open(yaml_path, 'w', encoding='utf-8') as f:
             yaml.dump(yaml_data, f, allow_unicode=True)
 
-        res_path = temp_dir / "res"
+        res_path = tmp_path / "res"
         sync = I18nSync(yaml_path=yaml_path)
         sync.apply_android(res_path=res_path, default_lang="en")
 
@@ -492,18 +673,18 @@ class TestApplyAndroid:
         assert '<string name="cancel">Отмена</string>' in ru_content
         assert 'save' not in ru_content
 
-    def test_apply_android_no_yaml(self, temp_dir):
+    def test_apply_android_no_yaml(self, tmp_path):
         """Test apply_android fails gracefully when YAML doesn't exist."""
-        res_path = temp_dir / "res"
-        yaml_path = temp_dir / "nonexistent.yaml"
+        res_path = tmp_path / "res"
+        yaml_path = tmp_path / "nonexistent.yaml"
         sync = I18nSync(yaml_path=yaml_path)
 
-        with pytest.raises(FileNotFoundError):
+        with pytest.raises(FileNotFoundError, match="YAML file not found"):
             sync.apply_android(res_path=res_path)
 
-    def test_apply_android_sorted_keys(self, temp_dir):
+    def test_apply_android_sorted_keys(self, tmp_path):
         """Test that keys are sorted alphabetically in output."""
-        yaml_path = temp_dir / "translations.yaml"
+        yaml_path = tmp_path / "translations.yaml"
         yaml_data = {
             "Localizable": {
                 "zebra": {"en": "Zebra"},
@@ -514,15 +695,13 @@ class TestApplyAndroid:
         with open(yaml_path, 'w', encoding='utf-8') as f:
             yaml.dump(yaml_data, f, allow_unicode=True)
 
-        res_path = temp_dir / "res"
+        res_path = tmp_path / "res"
         sync = I18nSync(yaml_path=yaml_path)
         sync.apply_android(res_path=res_path, default_lang="en")
 
         content = (res_path / "values" / "strings.xml").read_text(encoding='utf-8')
-        apple_pos = content.find("apple")
-        mango_pos = content.find("mango")
-        zebra_pos = content.find("zebra")
-        assert apple_pos < mango_pos < zebra_pos
+        names = re.findall(r'<string name="([^"]+)">', content)
+        assert names == ["apple", "mango", "zebra"]
 
     @pytest.mark.parametrize("ios_format,android_format", [
         # Single %@ -> %s
@@ -543,9 +722,9 @@ class TestApplyAndroid:
         ("%.2f MB", "%.2f MB"),
         ("%d of %d (%.1f%%)", "%1$d of %2$d (%3$.1f%%)"),
     ])
-    def test_apply_android_format_specifiers(self, temp_dir, ios_format, android_format):
+    def test_apply_android_format_specifiers(self, tmp_path, ios_format, android_format):
         """Test iOS format specifiers are converted to Android format."""
-        yaml_path = temp_dir / "translations.yaml"
+        yaml_path = tmp_path / "translations.yaml"
         yaml_data = {
             "Localizable": {
                 "testKey": {"en": ios_format},
@@ -554,7 +733,7 @@ class TestApplyAndroid:
         with open(yaml_path, 'w', encoding='utf-8') as f:
             yaml.dump(yaml_data, f, allow_unicode=True)
 
-        res_path = temp_dir / "res"
+        res_path = tmp_path / "res"
         sync = I18nSync(yaml_path=yaml_path)
         sync.apply_android(res_path=res_path, default_lang="en")
 
@@ -565,9 +744,9 @@ class TestApplyAndroid:
 class TestStringsdict:
     """Test parsing iOS .stringsdict files and generating Android plurals."""
 
-    def test_extract_stringsdict(self, temp_dir):
+    def test_extract_stringsdict(self, tmp_path):
         """Test extraction of plurals from .stringsdict files."""
-        resources = temp_dir / "Resources"
+        resources = tmp_path / "Resources"
         en_dir = resources / "en.lproj"
         en_dir.mkdir(parents=True)
 
@@ -625,7 +804,7 @@ class TestStringsdict:
 </dict>
 </plist>""", encoding='utf-8')
 
-        yaml_path = temp_dir / "translations.yaml"
+        yaml_path = tmp_path / "translations.yaml"
         sync = I18nSync(resources_path=resources, yaml_path=yaml_path)
         sync.extract()
 
@@ -648,9 +827,77 @@ class TestStringsdict:
         assert ru_plurals["many"] == "%d часов"
         assert ru_plurals["other"] == "%d часов"
 
-    def test_apply_android_plurals(self, temp_dir):
+    def test_extract_stringsdict_binary_and_non_string_values(self, tmp_path):
+        """Test plists outside the <dict>/<string> subset are still read."""
+        import plistlib
+
+        resources = tmp_path / "Resources"
+        en_dir = resources / "en.lproj"
+        en_dir.mkdir(parents=True)
+        ru_dir = resources / "ru.lproj"
+        ru_dir.mkdir(parents=True)
+
+        entry = {
+            "NSStringLocalizedFormatKey": "%#@items@",
+            "items": {
+                "NSStringFormatSpecTypeKey": "NSStringPluralRuleType",
+                "NSStringFormatValueTypeKey": "d",
+                "one": "%d item",
+                "other": "%d items",
+            },
+        }
+        (en_dir / "Localizable.stringsdict").write_bytes(
+            plistlib.dumps({"itemCount": entry, "version": 2, "tags": ["a"]})
+        )
+        (ru_dir / "Localizable.stringsdict").write_bytes(
+            plistlib.dumps({"itemCount": entry}, fmt=plistlib.FMT_BINARY)
+        )
+
+        yaml_path = tmp_path / "translations.yaml"
+        sync = I18nSync(resources_path=resources, yaml_path=yaml_path)
+        sync.extract()
+
+        assert sync.plurals["itemCount"]["en"] == {"one": "%d item", "other": "%d items"}
+        assert sync.plurals["itemCount"]["ru"] == {"one": "%d item", "other": "%d items"}
+
+    def test_extract_stringsdict_rejects_entity_declarations(self, tmp_path):
+        """Test XML entity declarations are rejected, not expanded."""
+        import plistlib
+
+        resources = tmp_path / "Resources"
+        en_dir = resources / "en.lproj"
+        en_dir.mkdir(parents=True)
+        (en_dir / "Localizable.stringsdict").write_text("""<?xml version="1.0" encoding="UTF-8"?>
+<!DOCTYPE plist [
+    <!ENTITY a "lol">
+    <!ENTITY b "&a;&a;&a;&a;">
+]>
+<plist version="1.0">
+<dict>
+    <key>itemCount</key>
+    <dict>
+        <key>NSStringLocalizedFormatKey</key>
+        <string>%#@items@</string>
+        <key>items</key>
+        <dict>
+            <key>NSStringFormatSpecTypeKey</key>
+            <string>NSStringPluralRuleType</string>
+            <key>other</key>
+            <string>&b;</string>
+        </dict>
+    </dict>
+</dict>
+</plist>""", encoding='utf-8')
+
+        yaml_path = tmp_path / "translations.yaml"
+        sync = I18nSync(resources_path=resources, yaml_path=yaml_path)
+
+        with pytest.raises(plistlib.InvalidFileException, match="entity declarations"):
+            sync.extract()
+
+    def test_apply_android_plurals(self, tmp_path):
         """Test generating Android plurals XML from YAML."""
-        yaml_path = temp_dir / "translations.yaml"
+        yaml_path = tmp_path / "translations.yaml"
         yaml_data = {
             "Localizable": {
                 "cancel": {"en": "Cancel", "ru": "Отмена"},
@@ -669,7 +916,7 @@ class TestStringsdict:
         with open(yaml_path, 'w', encoding='utf-8') as f:
             yaml.dump(yaml_data, f, allow_unicode=True)
 
-        res_path = temp_dir / "res"
+        res_path = tmp_path / "res"
         sync = I18nSync(yaml_path=yaml_path)
         sync.apply_android(res_path=res_path, default_lang="en")
 
@@ -688,9 +935,9 @@ class TestStringsdict:
         assert '<item quantity="many">%d часов</item>' in ru_content
         assert '<item quantity="other">%d часов</item>' in ru_content
 
-    def test_apply_android_plurals_escaping(self, temp_dir):
+    def test_apply_android_plurals_escaping(self, tmp_path):
         """Test that plurals values are properly XML escaped."""
-        yaml_path = temp_dir / "translations.yaml"
+        yaml_path = tmp_path / "translations.yaml"
         yaml_data = {
             "Plurals": {
                 "testPlural": {
@@ -701,7 +948,7 @@ class TestStringsdict:
         with open(yaml_path, 'w', encoding='utf-8') as f:
             yaml.dump(yaml_data, f, allow_unicode=True)
 
-        res_path = temp_dir / "res"
+        res_path = tmp_path / "res"
         sync = I18nSync(yaml_path=yaml_path)
         sync.apply_android(res_path=res_path, default_lang="en")
 
@@ -713,9 +960,9 @@ class TestStringsdict:
 class TestLocalesConfig:
     """Test generating Android locales_config.xml for per-app language support."""
 
-    def test_generates_locales_config(self, temp_dir):
+    def test_generates_locales_config(self, tmp_path):
         """Test that locales_config.xml is generated with all languages."""
-        yaml_path = temp_dir / "translations.yaml"
+        yaml_path = tmp_path / "translations.yaml"
         yaml_data = {
             "Localizable": {
                 "hello": {"en": "Hello", "ru": "Привет", "de": "Hallo"},
@@ -724,7 +971,7 @@ class TestLocalesConfig:
         with open(yaml_path, 'w', encoding='utf-8') as f:
             yaml.dump(yaml_data, f, allow_unicode=True)
 
-        res_path = temp_dir / "res"
+        res_path = tmp_path / "res"
         sync = I18nSync(yaml_path=yaml_path)
         sync.apply_android(res_path=res_path, default_lang="en")
 
@@ -740,9 +987,9 @@ class TestLocalesConfig:
         assert '<locale android:name="ru" />' in content
         assert '</locale-config>' in content
 
-    def test_locales_config_sorted_alphabetically(self, temp_dir):
+    def test_locales_config_sorted_alphabetically(self, tmp_path):
         """Test that locales are sorted alphabetically."""
-        yaml_path = temp_dir / "translations.yaml"
+        yaml_path = tmp_path / "translations.yaml"
         yaml_data = {
             "Localizable": {
                 "hello": {"zh-Hans": "你好", "en": "Hello", "fr": "Bonjour", "ar": "مرحبا"},
@@ -751,20 +998,17 @@ class TestLocalesConfig:
         with open(yaml_path, 'w', encoding='utf-8') as f:
             yaml.dump(yaml_data, f, allow_unicode=True)
 
-        res_path = temp_dir / "res"
+        res_path = tmp_path / "res"
         sync = I18nSync(yaml_path=yaml_path)
         sync.apply_android(res_path=res_path, default_lang="en")
 
         content = (res_path / "xml" / "locales_config.xml").read_text(encoding='utf-8')
-        ar_pos = content.find('android:name="ar"')
-        en_pos = content.find('android:name="en"')
-        fr_pos = content.find('android:name="fr"')
-        zh_pos = content.find('android:name="zh-CN"')  # zh-Hans maps to zh-CN
-        assert ar_pos < en_pos < fr_pos < zh_pos
+        locales = re.findall(r'android:name="([^"]+)"', content)
+        assert locales == ["ar", "en", "fr", "zh-CN"]  # zh-Hans maps to zh-CN
 
-    def test_locales_config_language_mapping(self, temp_dir):
+    def test_locales_config_language_mapping(self, tmp_path):
         """Test that iOS language codes are mapped to Android format in locales_config."""
-        yaml_path = temp_dir / "translations.yaml"
+        yaml_path = tmp_path / "translations.yaml"
         yaml_data = {
             "Localizable": {
                 "hello": {
@@ -779,7 +1023,7 @@ class TestLocalesConfig:
         with open(yaml_path, 'w', encoding='utf-8') as f:
             yaml.dump(yaml_data, f, allow_unicode=True)
 
-        res_path = temp_dir / "res"
+        res_path = tmp_path / "res"
         sync = I18nSync(yaml_path=yaml_path)
         sync.apply_android(res_path=res_path, default_lang="en")
 
@@ -794,9 +1038,9 @@ class TestLocalesConfig:
 class TestApplyStringsdict:
     """Test applying YAML plurals to iOS .stringsdict files."""
 
-    def test_apply_writes_stringsdict(self, temp_dir):
+    def test_apply_writes_stringsdict(self, tmp_path):
         """Test that apply() writes plurals from YAML to .stringsdict files."""
-        yaml_path = temp_dir / "translations.yaml"
+        yaml_path = tmp_path / "translations.yaml"
         yaml_data = {
             "Localizable": {
                 "cancel": {"en": "Cancel", "ru": "Отмена"},
@@ -811,7 +1055,7 @@ class TestApplyStringsdict:
         with open(yaml_path, 'w', encoding='utf-8') as f:
             yaml.dump(yaml_data, f, allow_unicode=True)
 
-        resources = temp_dir / "Resources"
+        resources = tmp_path / "Resources"
         sync = I18nSync(resources_path=resources, yaml_path=yaml_path)
         sync.apply()
 
@@ -845,9 +1089,9 @@ class TestApplyStringsdict:
         assert ru_plural["many"] == "%d элементов"
         assert ru_plural["other"] == "%d элементов"
 
-    def test_apply_stringsdict_preserves_existing_keys(self, temp_dir):
+    def test_apply_stringsdict_preserves_existing_keys(self, tmp_path):
         """Test that apply() preserves existing stringsdict keys not in YAML."""
-        resources = temp_dir / "Resources"
+        resources = tmp_path / "Resources"
         en_dir = resources / "en.lproj"
         en_dir.mkdir(parents=True)
 
@@ -875,7 +1119,7 @@ class TestApplyStringsdict:
 </dict>
 </plist>""", encoding='utf-8')
 
-        yaml_path = temp_dir / "translations.yaml"
+        yaml_path = tmp_path / "translations.yaml"
         yaml_data = {
             "Plurals": {
                 "new.plural": {
@@ -899,9 +1143,9 @@ class TestApplyStringsdict:
         assert plist["existing.plural"]["count"]["one"] == "%d thing"
         assert plist["new.plural"]["count"]["one"] == "%d file"
 
-    def test_apply_stringsdict_round_trip(self, temp_dir):
+    def test_apply_stringsdict_round_trip(self, tmp_path):
         """Test extract -> modify -> apply round trip for stringsdict."""
-        resources = temp_dir / "Resources"
+        resources = tmp_path / "Resources"
         en_dir = resources / "en.lproj"
         en_dir.mkdir(parents=True)
 
@@ -929,7 +1173,7 @@ class TestApplyStringsdict:
 </dict>
 </plist>""", encoding='utf-8')
 
-        yaml_path = temp_dir / "translations.yaml"
+        yaml_path = tmp_path / "translations.yaml"
         sync = I18nSync(resources_path=resources, yaml_path=yaml_path)
         sync.extract()
 
@@ -966,9 +1210,9 @@ class TestApplyStringsdict:
 class TestStringsdictWithFormatKey:
     """Test parsing iOS .stringsdict files with full format key (not just placeholder)."""
 
-    def test_extract_stringsdict_with_per_language_format_key(self, temp_dir):
+    def test_extract_stringsdict_with_per_language_format_key(self, tmp_path):
         """Test extraction of plurals where each language has its own NSStringLocalizedFormatKey."""
-        resources = temp_dir / "Resources"
+        resources = tmp_path / "Resources"
 
         # Create English stringsdict
         en_dir = resources / "en.lproj"
@@ -1022,7 +1266,7 @@ class TestStringsdictWithFormatKey:
 </dict>
 </plist>""", encoding='utf-8')
 
-        yaml_path = temp_dir / "translations.yaml"
+        yaml_path = tmp_path / "translations.yaml"
         sync = I18nSync(resources_path=resources, yaml_path=yaml_path)
         sync.extract()
 
@@ -1045,9 +1289,9 @@ class TestStringsdictWithFormatKey:
         assert plural_data["de"]["one"] == "%d Text"
         assert plural_data["de"]["other"] == "%d Texte"
 
-    def test_apply_android_plurals_with_per_language_format_key(self, temp_dir):
+    def test_apply_android_plurals_with_per_language_format_key(self, tmp_path):
         """Test Android plurals use per-language format_key."""
-        yaml_path = temp_dir / "translations.yaml"
+        yaml_path = tmp_path / "translations.yaml"
         yaml_data = {
             "Plurals": {
                 "trialLimitTextsCount": {
@@ -1067,7 +1311,7 @@ class TestStringsdictWithFormatKey:
         with open(yaml_path, 'w', encoding='utf-8') as f:
             yaml.dump(yaml_data, f, allow_unicode=True)
 
-        res_path = temp_dir / "res"
+        res_path = tmp_path / "res"
         sync = I18nSync(yaml_path=yaml_path)
         sync.apply_android(res_path=res_path, default_lang="en")
 
@@ -1083,9 +1327,9 @@ class TestStringsdictWithFormatKey:
         assert '<item quantity="one">Nur %d Text kostenlos. Unbegrenzter Zugang nur mit Premium.</item>' in de_content
         assert '<item quantity="other">Nur %d Texte kostenlos. Unbegrenzter Zugang nur mit Premium.</item>' in de_content
 
-    def test_extract_stringsdict_positional_plural(self, temp_dir):
+    def test_extract_stringsdict_positional_plural(self, tmp_path):
         """Test extraction of stringsdict with positional plural variable like %2$#@var@."""
-        resources = temp_dir / "Resources"
+        resources = tmp_path / "Resources"
         en_dir = resources / "en.lproj"
         en_dir.mkdir(parents=True)
         (en_dir / "Localizable.strings").write_text('"x" = "x";\n', encoding='utf-8')
@@ -1112,7 +1356,7 @@ class TestStringsdictWithFormatKey:
 </dict>
 </plist>""", encoding='utf-8')
 
-        yaml_path = temp_dir / "translations.yaml"
+        yaml_path = tmp_path / "translations.yaml"
         sync = I18nSync(resources_path=resources, yaml_path=yaml_path)
         sync.extract()
 
@@ -1125,9 +1369,9 @@ class TestStringsdictWithFormatKey:
         assert plural_data["en"]["other"] == "possible combinations"
         assert plural_data["en"]["_format_key"] == "%1$@ %2$#@combinations@"
 
-    def test_apply_stringsdict_positional_plural(self, temp_dir):
+    def test_apply_stringsdict_positional_plural(self, tmp_path):
         """Test applying YAML with positional plural variable produces correct stringsdict."""
-        yaml_path = temp_dir / "translations.yaml"
+        yaml_path = tmp_path / "translations.yaml"
         yaml_data = {
             "Localizable": {
                 "x": {"en": "x", "ru": "x"},
@@ -1152,7 +1396,7 @@ class TestStringsdictWithFormatKey:
         with open(yaml_path, 'w', encoding='utf-8') as f:
             yaml.dump(yaml_data, f, allow_unicode=True)
 
-        resources = temp_dir / "Resources"
+        resources = tmp_path / "Resources"
         sync = I18nSync(resources_path=resources, yaml_path=yaml_path)
         sync.apply()
 
@@ -1180,9 +1424,9 @@ class TestStringsdictWithFormatKey:
         assert ru_plural["few"] == "возможные комбинации"
         assert ru_plural["many"] == "возможных комбинаций"
 
-    def test_apply_stringsdict_key_level_format_key(self, temp_dir):
+    def test_apply_stringsdict_key_level_format_key(self, tmp_path):
         """Test that _format_key at key level (not per-language) applies to all languages."""
-        yaml_path = temp_dir / "translations.yaml"
+        yaml_path = tmp_path / "translations.yaml"
         yaml_data = {
             "Localizable": {
                 "x": {"en": "x", "ru": "x"},
@@ -1206,7 +1450,7 @@ class TestStringsdictWithFormatKey:
         with open(yaml_path, 'w', encoding='utf-8') as f:
             yaml.dump(yaml_data, f, allow_unicode=True)
 
-        resources = temp_dir / "Resources"
+        resources = tmp_path / "Resources"
         sync = I18nSync(resources_path=resources, yaml_path=yaml_path)
         sync.apply()
 